@@ -1,5 +1,11 @@
 """CLI module for Pennywise"""
 
-from .commands import main
+__version__ = "0.1.0"
 
-__all__ = ['main']
+
+def main():
+    """Run the CLI; the command modules are only imported once invoked"""
+    from .__main__ import main as _main
+    _main()
+
+__all__ = ['main', '__version__']
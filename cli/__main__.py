@@ -1,18 +1,46 @@
 """Main CLI entrypoint"""
-import typer
-from . import commands
+import sys
+from importlib import import_module
 
-app = typer.Typer()
+from cli import __version__
+
+# Sub-command name -> module defining its Typer app. Modules are imported on
+# demand so a command only pays for the dependencies it actually uses.
+COMMANDS = (
+    ("account", "cli.commands.accounts"),
+    ("currency", "cli.commands.currency"),
+    ("format", "cli.commands.formats"),
+    ("import", "cli.commands.imports"),
+    ("pot", "cli.commands.pots"),
+    ("reconcile", "cli.commands.reconcile"),
+    ("tx", "cli.commands.transactions"),
+)
+
+
+def build_app(argv: list[str]):
+    """Build the Typer app with the sub-command named in argv, or all of them if none matches"""
+    import typer
+
+    app = typer.Typer()
+    requested = argv[1] if len(argv) > 1 else None
+    selected = [c for c in COMMANDS if c[0] == requested] or COMMANDS
+    for name, module in selected:
+        app.add_typer(import_module(module).app, name=name)
+    return app
 
-# Add sub-commands
-app.add_typer(commands.accounts.app, name="account")
-app.add_typer(commands.currency.app, name="currency")
-app.add_typer(commands.formats.app, name="format")
-app.add_typer(commands.pots.app, name="pot")
-app.add_typer(commands.transactions.app, name="tx")
 
 def main():
-    app()
+    # Answer --version before Typer or any command module is imported
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        print(__version__)
+        sys.exit(0)
+
+    # Help (and a bare invocation, which only prints usage) never touches the
+    # database, so don't import it or create budget.db for them
+    if len(sys.argv) > 1 and "--help" not in sys.argv[1:]:
+        from database import init_db
+        init_db()  # Ensure database tables exist
+    build_app(sys.argv)()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,8 +1,9 @@
-"""CLI command modules"""
-from . import accounts
-from . import currency
-from . import formats
-from . import pots
-from . import transactions
+"""
+CLI command modules
 
-__all__ = ["accounts", "currency", "formats", "pots", "transactions"]
\ No newline at end of file
+Each module imports Rich, the database, services and schemas inside the
+command functions that use them, so --help and argument errors don't pay for
+those imports.
+"""
+
+__all__ = ["accounts", "currency", "formats", "imports", "pots", "reconcile", "transactions"]
\ No newline at end of file
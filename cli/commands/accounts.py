@@ -1,19 +1,16 @@
 """Account-related CLI commands"""
+import click
 import typer
 from decimal import Decimal
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 from typing import cast
 
-from database import get_db
-from modules.accounts.service import AccountService
-from modules.transactions.service import TransactionService
-from modules.currencies.service import CurrencyService
-from models.accounts import AccountType
-
 app = typer.Typer()
-console = Console()
+
+DECIMAL_ZERO = Decimal("0")
+
+# Kept in sync with models.accounts.AccountType; listed here to avoid importing
+# the models at startup just to validate and render --type.
+ACCOUNT_TYPES = ("current", "savings", "credit_card", "loan", "mortgage", "crypto")
 
 # Common options
 ACCOUNT_NAME = cast(str, typer.Option(..., "--name", "-n", help="Account name"))
@@ -23,7 +20,8 @@ ACCOUNT_TYPE = cast(
         "current",
         "--type",
         "-t",
-        help=f"Account type ({', '.join(t.value for t in AccountType)})",
+        help="Account type",
+        click_type=click.Choice(ACCOUNT_TYPES),
     ),
 )
 
@@ -35,56 +33,77 @@ def create(
     balance: float = typer.Option(0.0, "--balance", "-b", help="Initial balance"),
 ):
     """Create a new account"""
-    db = next(get_db())
-    account_service = AccountService(db)
-    currency_service = CurrencyService(db)
+    from rich import print as rprint
+    from database import SessionLocal
+    from modules.accounts.service import AccountService
+
+    with SessionLocal() as db:
+        account_service = AccountService(db)
+        currency_service = account_service.transaction_service.currency_service
     
-    try:
-        currency = currency_service.get_by_code(currency_code)
-        if not currency:
-            rprint(f"[red]Error:[/red] Currency {currency_code} not found")
-            return
+        try:
+            currency = currency_service.get_by_code(currency_code)
+            if not currency:
+                rprint(f"[red]Error:[/red] Currency {currency_code} not found")
+                return
             
-        account = account_service.create_account(
-            name=name,
-            account_type=type,
-            currency_id=currency.id,
-            initial_balance=Decimal(str(balance))
-        )
+            account = account_service.create_account(
+                name=name,
+                account_type=type,
+                currency_id=currency.id,
+                initial_balance=Decimal(str(balance))
+            )
         
-        rprint(f"[green]Created account:[/green] {account.name} (ID: {account.id})")
-        rprint(f"Currency: {currency.code} ({currency.symbol})")
-        if balance > 0:
-            rprint(f"Initial balance: {currency.symbol}{balance:.{currency.decimals}f}")
-    except Exception as e:
-        rprint(f"[red]Error creating account:[/red] {str(e)}")
+            rprint(f"[green]Created account:[/green] {account.name} (ID: {account.id})")
+            rprint(f"Currency: {currency.code} ({currency.symbol})")
+            if balance > 0:
+                rprint(f"Initial balance: {currency.symbol}{balance:.{currency.decimals}f}")
+        except Exception as e:
+            rprint(f"[red]Error creating account:[/red] {str(e)}")
 
 @app.command()
 def list():
     """List all accounts and their balances"""
-    db = next(get_db())
-    service = AccountService(db)
-    accounts = service.get_all()
+    from rich.console import Console
+    from rich.table import Column, Table
+    from database import SessionLocal
+    from modules.accounts.service import AccountService
 
-    table = Table(
-        "ID", "Name", "Type", "Currency", "Balance", "Pot Balance", "Available"
-    )
-    for account in accounts:
-        pot_balance = (
-            sum(TransactionService(db).get_pot_balance(pot.id) for pot in account.pots)
-            if account.pots
-            else Decimal("0.00")
-        )
-        available = account.balance - pot_balance
-        symbol = account.currency.symbol
+    console = Console(highlight=False)
+    with SessionLocal() as db:
+        service = AccountService(db)
+        accounts = service.list_accounts()
 
-        table.add_row(
-            str(account.id),
-            account.name,
-            account.type,
-            f"{account.currency.code} ({account.currency.type.value})",
-            f"{symbol}{account.balance:.{account.currency.decimals}f}",
-            f"{symbol}{float(pot_balance):.{account.currency.decimals}f}",
-            f"{symbol}{float(available):.{account.currency.decimals}f}",
+        table = Table(
+            "ID",
+            "Name",
+            "Type",
+            "Currency",
+            Column("Balance", no_wrap=True, overflow="ignore"),
+            Column("Pot Balance", no_wrap=True, overflow="ignore"),
+            Column("Available", no_wrap=True, overflow="ignore"),
         )
-    console.print(table)
\ No newline at end of file
+        pot_balances = service.transaction_service.get_pot_balances(
+            [pot.id for account in accounts for pot in account.pots]
+        )
+        for account in accounts:
+            pot_balance = sum(
+                (pot_balances.get(pot.id, DECIMAL_ZERO) for pot in account.pots),
+                DECIMAL_ZERO,
+            )
+            available = account.balance - pot_balance
+            currency = account.currency
+            symbol = currency.symbol
+            decimals = currency.decimals
+            money = f"{symbol}{{:.{decimals}f}}".format
+
+            table.add_row(
+                str(account.id),
+                account.name,
+                account.type,
+                f"{currency.code} ({currency.type.value})",
+                money(account.balance),
+                money(pot_balance),
+                money(available),
+            )
+        console.print(table)
\ No newline at end of file
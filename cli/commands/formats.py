@@ -1,50 +1,50 @@
 """CLI commands for managing import formats"""
 from pathlib import Path
 import typer
-from tabulate import tabulate
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import TYPE_CHECKING, Optional
 
-from database import get_db
-from modules.imports.formats import ImportFormatService
-from modules.accounts.service import AccountService
-from schemas.import_formats import ImportFormat
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
 
 app = typer.Typer()
 
-def get_session() -> Session:
+def get_session() -> "Session":
     """Get database session"""
-    return next(get_db())
+    from database import SessionLocal
+    return SessionLocal()
 
 @app.command()
 def list_formats():
     """List available import formats"""
-    db = get_session()
-    service = ImportFormatService(db)
-    formats = service.list_formats()
+    from tabulate import tabulate
+    from modules.imports.formats import ImportFormatService
+
+    with get_session() as db:
+        service = ImportFormatService(db)
+        formats = service.list_formats()
     
-    rows = []
-    for fmt in formats:
-        rows.append([
-            fmt.id,
-            fmt.name,
-            fmt.date_column,
-            fmt.amount_column,
-            fmt.description_column,
-            fmt.account.name if fmt.account else None
-        ])
+        rows = []
+        for fmt in formats:
+            rows.append([
+                fmt.id,
+                fmt.name,
+                fmt.date_column,
+                fmt.amount_column,
+                fmt.description_column,
+                fmt.account.name if fmt.account else None
+            ])
         
-    if rows:
-        print(tabulate(rows, headers=[
-            "ID",
-            "Name",
-            "Date Column",
-            "Amount Column",
-            "Description Column",
-            "Default Account"
-        ]))
-    else:
-        print("No import formats found")
+        if rows:
+            print(tabulate(rows, headers=[
+                "ID",
+                "Name",
+                "Date Column",
+                "Amount Column",
+                "Description Column",
+                "Default Account"
+            ]))
+        else:
+            print("No import formats found")
 
 @app.command()
 def create_format(
@@ -62,28 +62,31 @@ def create_format(
     notes: Optional[str] = typer.Option(None, help="Additional notes about the format")
 ):
     """Create a new import format"""
-    db = get_session()
-    service = ImportFormatService(db)
-    # Check if format already exists
-    if service.get_by_name(name):
-        typer.echo(f"Error: Format with name '{name}' already exists")
-        raise typer.Exit(1)
-    fmt = ImportFormat(
-        name=name,
-        date_column=date_column,
-        amount_column=amount_column,
-        description_column=description_column,
-        type_column=type_column,
-        balance_column=balance_column,
-        reference_column=reference_column,
-        date_format=date_format,
-        thousands_separator=thousands_separator,
-        decimal_separator=decimal_separator,
-        encoding=encoding,
-        notes=notes
-    )
-    service.create(fmt)
-    typer.echo(f"Created import format '{name}'")
+    from modules.imports.formats import ImportFormatService
+    from schemas.import_formats import ImportFormat
+
+    with get_session() as db:
+        service = ImportFormatService(db)
+        # Check if format already exists
+        if service.get_by_name(name):
+            typer.echo(f"Error: Format with name '{name}' already exists")
+            raise typer.Exit(1)
+        fmt = ImportFormat(
+            name=name,
+            date_column=date_column,
+            amount_column=amount_column,
+            description_column=description_column,
+            type_column=type_column,
+            balance_column=balance_column,
+            reference_column=reference_column,
+            date_format=date_format,
+            thousands_separator=thousands_separator,
+            decimal_separator=decimal_separator,
+            encoding=encoding,
+            notes=notes
+        )
+        service.create(fmt)
+        typer.echo(f"Created import format '{name}'")
 
 @app.command()
 def set_account_format(
@@ -91,19 +94,22 @@ def set_account_format(
     account_name: str = typer.Argument(..., help="Name of the account")
 ):
     """Set default format for an account"""
-    db = get_session()
-    format_service = ImportFormatService(db)
-    account_service = AccountService(db)
-    fmt = format_service.get(format_id)
-    if not fmt:
-        typer.echo(f"Error: Import format {format_id} not found")
-        raise typer.Exit(1)
-    account = account_service.get_by_name(account_name)
-    if not account:
-        typer.echo(f"Error: Account '{account_name}' not found")
-        raise typer.Exit(1)
-    format_service.set_account_format(account.id, format_id)
-    typer.echo(f"Set import format '{fmt.name}' as default for account '{account_name}'")
+    from modules.imports.formats import ImportFormatService
+    from modules.accounts.service import AccountService
+
+    with get_session() as db:
+        format_service = ImportFormatService(db)
+        account_service = AccountService(db)
+        fmt = format_service.get(format_id)
+        if not fmt:
+            typer.echo(f"Error: Import format {format_id} not found")
+            raise typer.Exit(1)
+        account = account_service.get_by_name(account_name)
+        if not account:
+            typer.echo(f"Error: Account '{account_name}' not found")
+            raise typer.Exit(1)
+        format_service.set_account_format(account.id, format_id)
+        typer.echo(f"Set import format '{fmt.name}' as default for account '{account_name}'")
 
 @app.command()
 def export_format(
@@ -111,25 +117,29 @@ def export_format(
     output_file: Path = typer.Argument(..., help="Output JSON file path")
 ):
     """Export import format to JSON file"""
-    db = get_session()
-    service = ImportFormatService(db)
-    fmt = service.get(format_id)
-    if not fmt:
-        typer.echo(f"Error: Import format {format_id} not found")
-        raise typer.Exit(1)
-    service.export_json(format_id, output_file)
-    typer.echo(f"Exported format '{fmt.name}' to {output_file}")
+    from modules.imports.formats import ImportFormatService
+
+    with get_session() as db:
+        service = ImportFormatService(db)
+        fmt = service.get(format_id)
+        if not fmt:
+            typer.echo(f"Error: Import format {format_id} not found")
+            raise typer.Exit(1)
+        service.export_json(format_id, output_file)
+        typer.echo(f"Exported format '{fmt.name}' to {output_file}")
 
 @app.command()
 def import_format(
     input_file: Path = typer.Argument(..., help="Input JSON file path", exists=True)
 ):
     """Import format from JSON file"""
-    db = get_session()
-    service = ImportFormatService(db)
-    try:
-        fmt = service.import_json(input_file)
-        typer.echo(f"Imported format '{fmt.name}'")
-    except Exception as e:
-        typer.echo(f"Error importing format: {e}")
-        raise typer.Exit(1)
\ No newline at end of file
+    from modules.imports.formats import ImportFormatService
+
+    with get_session() as db:
+        service = ImportFormatService(db)
+        try:
+            fmt = service.import_json(input_file)
+            typer.echo(f"Imported format '{fmt.name}'")
+        except Exception as e:
+            typer.echo(f"Error importing format: {e}")
+            raise typer.Exit(1)
\ No newline at end of file
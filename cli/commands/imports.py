@@ -4,58 +4,77 @@ import logging
 import sys
 import json
 import typer
-from typing import Optional
-from sqlalchemy.orm import Session
-from rich import print
-from rich.prompt import Prompt
+from typing import TYPE_CHECKING, Optional
 
-from modules.imports.service import ImportService
-from database import Base, get_db
-from models.transactions import Transaction
-from schemas.import_formats import ImportFormat
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 app = typer.Typer(help="Import bank statements")
 
-def get_session() -> Session:
+def get_session() -> "Session":
     """Get database session"""
-    return next(get_db())
+    from database import SessionLocal
+    return SessionLocal()
 
 @app.command("format")
 def create_format(
     name: str = typer.Option(..., "--name", "-n", help="Name for this import format"),
     db_save: bool = typer.Option(True, "--db-save/--no-db-save", help="Save format to database"),
     file_save: bool = typer.Option(True, "--file-save/--no-file-save", help="Save format to file"),
+    spec_file: Optional[Path] = typer.Option(None, "--spec-file",
+                                           help="Read the format from a JSON file instead of prompting",
+                                           exists=True, file_okay=True, dir_okay=False),
 ):
-    """Create a new import format interactively"""
-    fmt = ImportFormat(
-        name=name,
-        date_column=Prompt.ask("Date column name"),
-        amount_column=Prompt.ask("Amount column name"),
-        description_column=Prompt.ask("Description column name"),
-        type_column=Prompt.ask("Type column name (optional)", default="") or None,
-        balance_column=Prompt.ask("Balance column name (optional)", default="") or None,
-        reference_column=Prompt.ask("Reference column name (optional)", default="") or None,
-        date_format=Prompt.ask("Date format (e.g., %d/%m/%Y)", default="%Y-%m-%d"),
-        thousands_separator=Prompt.ask("Thousands separator", default=","),
-        decimal_separator=Prompt.ask("Decimal separator", default="."),
-        encoding=Prompt.ask("File encoding", default="utf-8-sig"),
-        notes=Prompt.ask("Notes about this format", default="") or None
-    )
+    """Create a new import format interactively, or from a JSON spec file"""
+    from rich import print
+    from schemas.import_formats import ImportFormat
+
+    if spec_file:
+        from pydantic import ValidationError
+
+        try:
+            data = json.loads(spec_file.read_text())
+            if isinstance(data, dict):
+                data.setdefault("name", name)
+            fmt = ImportFormat.model_validate(data)
+        except (json.JSONDecodeError, ValidationError) as e:
+            typer.echo(f"Error reading format spec: {e}")
+            raise typer.Exit(1)
+        if fmt.name != name:
+            typer.echo(f"Error: spec file names the format '{fmt.name}' but --name is '{name}'")
+            raise typer.Exit(1)
+    else:
+        from rich.prompt import Prompt
+
+        fmt = ImportFormat(
+            name=name,
+            date_column=Prompt.ask("Date column name"),
+            amount_column=Prompt.ask("Amount column name"),
+            description_column=Prompt.ask("Description column name"),
+            type_column=Prompt.ask("Type column name (optional)", default="") or None,
+            balance_column=Prompt.ask("Balance column name (optional)", default="") or None,
+            reference_column=Prompt.ask("Reference column name (optional)", default="") or None,
+            date_format=Prompt.ask("Date format (e.g., %d/%m/%Y)", default="%Y-%m-%d"),
+            thousands_separator=Prompt.ask("Thousands separator", default=","),
+            decimal_separator=Prompt.ask("Decimal separator", default="."),
+            encoding=Prompt.ask("File encoding", default="utf-8-sig"),
+            notes=Prompt.ask("Notes about this format", default="") or None
+        )
     
     print("\nFormat created:")
     print(fmt.model_dump_json(indent=2))
     
     if db_save:
-        session = get_session()
-        from modules.imports.formats import ImportFormatService
-        service = ImportFormatService(session)
-        try:
-            service.create(fmt)
-            print("\nSaved format to database")
-        except Exception as e:
-            print(f"\n[red]Error saving to database: {e}[/red]")
-            db_save = False
+        with get_session() as session:
+            from modules.imports.formats import ImportFormatService
+            service = ImportFormatService(session)
+            try:
+                service.create(fmt)
+                print("\nSaved format to database")
+            except Exception as e:
+                print(f"\n[red]Error saving to database: {e}[/red]")
+                db_save = False
     
     if file_save:
         # Save to formats directory
@@ -81,26 +100,31 @@ def import_statement(
                                              help="Path to format JSON file")
 ):
     """Import transactions from a bank statement"""
+    from rich import print
+    from modules.imports.service import ImportService
+    from models.transactions import Transaction
+    from schemas.import_formats import ImportFormat
+
     try:
-        session = get_session()
-        service = ImportService(model=Transaction, db=session)
+        with get_session() as session:
+            service = ImportService(model=Transaction, db=session)
         
-        # Get format definition
-        fmt = None
-        if format_file:
-            fmt = ImportFormat.model_validate_json(format_file.read_text())
-        elif format_name:
-            fmt = format_name  # Service will look up by name
-        elif format_id:
-            fmt = format_id  # Service will look up by ID
+            # Get format definition
+            fmt = None
+            if format_file:
+                fmt = ImportFormat.model_validate_json(format_file.read_text())
+            elif format_name:
+                fmt = format_name  # Service will look up by name
+            elif format_id:
+                fmt = format_id  # Service will look up by ID
             
-        statement = service.import_file(file_path, fmt=fmt, account_id=int(account_id))
+            statement = service.import_file(file_path, fmt=fmt, account_id=int(account_id))
         
-        # Print summary
-        print(f"Successfully imported {len(statement.transactions)} transactions")
-        print(f"Date range: {statement.start_date.date()} to {statement.end_date.date()}")
-        if statement.end_balance:
-            print(f"Final balance: {statement.end_balance}")
+            # Print summary
+            print(f"Successfully imported {len(statement.transactions)} transactions")
+            print(f"Date range: {statement.start_date.date()} to {statement.end_date.date()}")
+            if statement.end_balance:
+                print(f"Final balance: {statement.end_balance}")
             
     except Exception as e:
         print(f"[red]Error importing file: {str(e)}[/red]")
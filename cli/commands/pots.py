@@ -2,21 +2,13 @@
 import typer
 from decimal import Decimal
 from datetime import datetime, timedelta
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 from typing import cast
 
-from database import get_db
-from modules.accounts.service import AccountService
-from modules.transactions.service import TransactionService
-from models.accounts import Pot
-
 app = typer.Typer()
-console = Console()
 
 # Common options
-DECIMAL_ZERO = Decimal(0.0)
+DECIMAL_ZERO = Decimal("0")
+HUNDRED = Decimal(100)
 ACCOUNT_ID = cast(int, typer.Option(..., "--account", "-a", help="Account ID"))
 POT_NAME = cast(str, typer.Option(..., "--name", "-n", help="Pot name"))
 POT_ID = cast(int, typer.Option(..., "--pot", "-p", help="Pot ID"))
@@ -34,52 +26,64 @@ def create(
     target: str = TARGET_AMOUNT,
 ):
     """Create a new savings pot within an account"""
-    db = next(get_db())
-    service = AccountService(db)
-    decimal_target: Decimal = Decimal(target)
-    try:
-        pot = service.create_pot(
-            account_id,
-            name,
-            target_amount=decimal_target,
-        )
-        rprint(f"[green]Created pot:[/green] {pot.name} in account {account_id}")
-    except Exception as e:
-        rprint(f"[red]Error creating pot:[/red] {str(e)}")
+    from rich import print as rprint
+    from database import SessionLocal
+    from modules.accounts.service import AccountService
+
+    with SessionLocal() as db:
+        service = AccountService(db)
+        decimal_target: Decimal = Decimal(target)
+        try:
+            pot = service.create_pot(
+                account_id,
+                name,
+                target_amount=decimal_target,
+            )
+            rprint(f"[green]Created pot:[/green] {pot.name} in account {account_id}")
+        except Exception as e:
+            rprint(f"[red]Error creating pot:[/red] {str(e)}")
 
 @app.command()
 def list(account_id: int | None = ACCOUNT_ID):
     """List all savings pots and their balances"""
-    db = next(get_db())
-    account_service = AccountService(db)
-    transaction_service = TransactionService(db)
-
-    accounts = (
-        [account_service.get(account_id)] if account_id else account_service.get_all()
-    )
+    from rich.console import Console
+    from rich.table import Column, Table
+    from database import SessionLocal
+    from modules.accounts.service import AccountService
+
+    console = Console(highlight=False)
+    with SessionLocal() as db:
+        account_service = AccountService(db)
+        transaction_service = account_service.transaction_service
+
+        accounts = account_service.list_accounts(account_id, with_pots_only=True)
+        pot_balances = transaction_service.get_pot_balances(
+            [pot.id for account in accounts for pot in account.pots]
+        )
 
-    for account in accounts:
-        if account and account.pots:
+        for account in accounts:
             console.print(f"\n[bold]{account.name}[/bold] ({account.currency.code})")
-            table = Table("ID", "Name", "Target", "Current Amount", "Progress")
-            
+            table = Table(
+                "ID",
+                "Name",
+                Column("Target", no_wrap=True, overflow="ignore"),
+                Column("Current Amount", no_wrap=True, overflow="ignore"),
+                Column("Progress", no_wrap=True, overflow="ignore"),
+            )
+        
             decimals = account.currency.decimals
             symbol = account.currency.symbol
-            
+            money = f"{symbol}{{:.{decimals}f}}".format
+        
             for pot in account.pots:
-                balance = transaction_service.get_pot_balance(pot.id)
-                progress = (
-                    f"{(balance / Decimal(str(pot.target_amount)) * 100):.1f}%"
-                    if pot.target_amount
-                    else "N/A"
-                )
+                balance = pot_balances.get(pot.id, DECIMAL_ZERO)
+                target = pot.target_amount
+                progress = f"{(balance / target * HUNDRED):.1f}%" if target else "N/A"
                 table.add_row(
                     str(pot.id),
                     pot.name,
-                    f"{symbol}{Decimal(str(pot.target_amount)):.{decimals}f}"
-                    if pot.target_amount
-                    else "No target",
-                    f"{symbol}{balance:.{decimals}f}",
+                    money(target) if target else "No target",
+                    money(balance),
                     progress,
                 )
             console.print(table)
@@ -93,42 +97,46 @@ def transfer(
     description: str | None = DESCRIPTION,
 ):
     """Transfer money to/from a savings pot"""
-    db = next(get_db())
-    service = TransactionService(db)
-    account_service = AccountService(db)
-    amount_decimal: Decimal = Decimal(amount)
+    from rich import print as rprint
+    from database import SessionLocal
+    from modules.accounts.service import AccountService
+
+    with SessionLocal() as db:
+        account_service = AccountService(db)
+        service = account_service.transaction_service
+        amount_decimal: Decimal = Decimal(amount)
     
-    try:
-        account = account_service.get(account_id)
-        if not account:
-            raise ValueError("Account not found")
+        try:
+            account = account_service.get(account_id)
+            if not account:
+                raise ValueError("Account not found")
             
-        decimals = account.currency.decimals
-        symbol = account.currency.symbol
+            decimals = account.currency.decimals
+            symbol = account.currency.symbol
         
-        if direction == "to_pot":
-            transaction = service.transfer_to_pot(
-                account_id=account_id,
-                pot_id=pot_id,
-                amount=amount_decimal,
-                description=description,
-            )
-        elif direction == "from_pot":
-            transaction = service.transfer_from_pot(
-                account_id=account_id,
-                pot_id=pot_id,
-                amount=amount_decimal,
-                description=description,
-            )
-        else:
-            raise ValueError("Direction must be either 'to_pot' or 'from_pot'")
+            if direction == "to_pot":
+                transaction = service.transfer_to_pot(
+                    account_id=account_id,
+                    pot_id=pot_id,
+                    amount=amount_decimal,
+                    description=description,
+                )
+            elif direction == "from_pot":
+                transaction = service.transfer_from_pot(
+                    account_id=account_id,
+                    pot_id=pot_id,
+                    amount=amount_decimal,
+                    description=description,
+                )
+            else:
+                raise ValueError("Direction must be either 'to_pot' or 'from_pot'")
 
-        rprint(
-            f"[green]Successfully transferred[/green] "
-            f"{symbol}{amount_decimal:.{decimals}f} {direction.replace('_', ' ')}"
-        )
-    except Exception as e:
-        rprint(f"[red]Pot transfer failed:[/red] {str(e)}")
+            rprint(
+                f"[green]Successfully transferred[/green] "
+                f"{symbol}{amount_decimal:.{decimals}f} {direction.replace('_', ' ')}"
+            )
+        except Exception as e:
+            rprint(f"[red]Pot transfer failed:[/red] {str(e)}")
 
 @app.command()
 def transfer_between(
@@ -139,32 +147,36 @@ def transfer_between(
     description: str | None = DESCRIPTION,
 ):
     """Transfer money between two pots in the same account"""
-    db = next(get_db())
-    service = TransactionService(db)
-    account_service = AccountService(db)
-    amount_decimal: Decimal = Decimal(amount)
+    from rich import print as rprint
+    from database import SessionLocal
+    from modules.accounts.service import AccountService
+
+    with SessionLocal() as db:
+        account_service = AccountService(db)
+        service = account_service.transaction_service
+        amount_decimal: Decimal = Decimal(amount)
     
-    try:
-        account = account_service.get(account_id)
-        if not account:
-            raise ValueError("Account not found")
+        try:
+            account = account_service.get(account_id)
+            if not account:
+                raise ValueError("Account not found")
             
-        decimals = account.currency.decimals
-        symbol = account.currency.symbol
+            decimals = account.currency.decimals
+            symbol = account.currency.symbol
         
-        transaction = service.transfer_between_pots(
-            account_id=account_id,
-            from_pot_id=from_pot,
-            to_pot_id=to_pot,
-            amount=amount_decimal,
-            description=description,
-        )
-        rprint(
-            f"[green]Successfully transferred[/green] "
-            f"{symbol}{amount_decimal:.{decimals}f} between pots"
-        )
-    except Exception as e:
-        rprint(f"[red]Pot transfer failed:[/red] {str(e)}")
+            transaction = service.transfer_between_pots(
+                account_id=account_id,
+                from_pot_id=from_pot,
+                to_pot_id=to_pot,
+                amount=amount_decimal,
+                description=description,
+            )
+            rprint(
+                f"[green]Successfully transferred[/green] "
+                f"{symbol}{amount_decimal:.{decimals}f} between pots"
+            )
+        except Exception as e:
+            rprint(f"[red]Pot transfer failed:[/red] {str(e)}")
 
 @app.command()
 def transactions(
@@ -172,47 +184,57 @@ def transactions(
     days: int = typer.Option(30, "--days", "-d", help="Number of days of history to show"),
 ):
     """Show transaction history for a specific pot"""
-    db = next(get_db())
-    service = TransactionService(db)
-    account_service = AccountService(db)
-
-    try:
-        pot = db.query(Pot).get(pot_id)
-        if not pot:
-            raise ValueError("Pot not found")
+    from rich.console import Console
+    from rich.table import Column, Table
+    from rich import print as rprint
+    from database import SessionLocal
+    from modules.accounts.service import AccountService
+
+    console = Console(highlight=False)
+    with SessionLocal() as db:
+        account_service = AccountService(db)
+        service = account_service.transaction_service
+
+        try:
+            pot = account_service.get_pot_with_account(pot_id)
+            if not pot:
+                raise ValueError("Pot not found")
             
-        account = account_service.get(pot.account_id)
-        if not account:
-            raise ValueError("Account not found")
+            account = pot.account
+            if not account:
+                raise ValueError("Account not found")
             
-        decimals = account.currency.decimals
-        symbol = account.currency.symbol
+            decimals = account.currency.decimals
+            symbol = account.currency.symbol
+            money = f"{symbol}{{:.{decimals}f}}".format
 
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=days)
+            end_date = datetime.now().date()
+            start_date = end_date - timedelta(days=days)
 
-        transactions = service.get_pot_transactions(pot_id, start_date, end_date)
+            legs = service.get_pot_legs(pot_id, start_date, end_date)
 
-        if not transactions:
-            rprint(
-                "[yellow]No transactions found for this pot in the specified time period[/yellow]"
+            if not legs:
+                rprint(
+                    "[yellow]No transactions found for this pot in the specified time period[/yellow]"
+                )
+                return
+
+            console.print(f"\nTransactions for pot: {pot.name}")
+            console.print(f"Currency: {account.currency.code} ({symbol})")
+            table = Table(
+                "Date",
+                "Description",
+                Column("Amount", no_wrap=True, overflow="ignore"),
+                "Type",
             )
-            return
-
-        console.print(f"\nTransactions for pot: {pot.name}")
-        console.print(f"Currency: {account.currency.code} ({symbol})")
-        table = Table("Date", "Description", "Amount", "Type")
-        
-        for tx in transactions:
-            for leg in service.get_transaction_legs(tx.id):
-                if leg.pot_id == pot_id:
-                    amount = leg.credit if leg.credit is not None else (-leg.debit if leg.debit is not None else Decimal("0"))
-                    table.add_row(
-                        tx.date.strftime("%Y-%m-%d"),
-                        tx.description or "",
-                        f"{symbol}{abs(amount):.{decimals}f}",
-                        "IN" if amount > 0 else "OUT",
-                    )
-        console.print(table)
-    except Exception as e:
-        rprint(f"[red]Error:[/red] {str(e)}")
\ No newline at end of file
+            for leg in legs:
+                amount = leg.credit if leg.credit is not None else (-leg.debit if leg.debit is not None else DECIMAL_ZERO)
+                table.add_row(
+                    leg.date.isoformat(),
+                    leg.description or "",
+                    money(abs(amount)),
+                    "IN" if amount > 0 else "OUT",
+                )
+            console.print(table)
+        except Exception as e:
+            rprint(f"[red]Error:[/red] {str(e)}")
\ No newline at end of file
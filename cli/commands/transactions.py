@@ -1,19 +1,14 @@
 """Transaction-related CLI commands"""
+import csv
+import sys
 import typer
 from decimal import Decimal
 from datetime import datetime, timedelta
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 from typing import cast
 
-from database import get_db
-from modules.accounts.service import AccountService
-from modules.transactions.service import TransactionService
-from modules.currencies.service import CurrencyService
-
 app = typer.Typer()
-console = Console()
+
+DECIMAL_ZERO = Decimal("0")
 
 # Common options
 AMOUNT = cast(str, typer.Option("0.0", "--amount", "-a", help="Amount to transfer"))
@@ -21,6 +16,8 @@ DESCRIPTION = cast(str, typer.Option(None, "--desc", "-d", help="Transfer descri
 FROM_ACCOUNT_ID = cast(int, typer.Option(..., "--from", "-f", help="Source account ID"))
 TO_ACCOUNT_ID = cast(int, typer.Option(..., "--to", "-t", help="Destination account ID"))
 SHOW_LEGS = cast(bool, typer.Option(False, "--legs", "-l", help="Show transaction legs"))
+LIMIT = cast(int, typer.Option(500, "--limit", "-n", help="Maximum number of transactions to show"))
+PLAIN = cast(bool, typer.Option(False, "--plain", help="Print tab-separated rows instead of a table"))
 
 @app.command()
 def transfer(
@@ -30,112 +27,165 @@ def transfer(
     description: str = DESCRIPTION,
 ):
     """Transfer money between accounts (with automatic currency conversion)"""
-    db = next(get_db())
-    account_service = AccountService(db)
-    transaction_service = TransactionService(db)
-    currency_service = CurrencyService(db)
+    from rich import print as rprint
+    from database import SessionLocal
+    from modules.accounts.service import AccountService
+
+    with SessionLocal() as db:
+        account_service = AccountService(db)
+        transaction_service = account_service.transaction_service
+        currency_service = transaction_service.currency_service
     
-    try:
-        from_account = account_service.get(from_id)
-        to_account = account_service.get(to_id)
-        if not from_account or not to_account:
-            raise ValueError("One or both accounts not found")
+        try:
+            from_account = account_service.get(from_id)
+            to_account = account_service.get(to_id)
+            if not from_account or not to_account:
+                raise ValueError("One or both accounts not found")
             
-        amount_decimal = Decimal(amount)
+            amount_decimal = Decimal(amount)
+            from_currency = from_account.currency
+            to_currency = to_account.currency
+            from_money = f"{from_currency.symbol}{{:.{from_currency.decimals}f}}".format
+            to_money = f"{to_currency.symbol}{{:.{to_currency.decimals}f}}".format
+            from_name = from_account.name
+            to_name = to_account.name
+            converting = from_account.currency_id != to_account.currency_id
             
-        if from_account.currency_id != to_account.currency_id:
-            rate = currency_service.get_exchange_rate(
-                from_account.currency.code,
-                to_account.currency.code
-            )
-            if rate is None:
-                raise ValueError(
-                    f"No exchange rate found from {from_account.currency.code} "
-                    f"to {to_account.currency.code}"
+            if converting:
+                rate = currency_service.get_exchange_rate(
+                    from_currency.code,
+                    to_currency.code
                 )
-            converted_amount = amount_decimal * rate
+                if rate is None:
+                    raise ValueError(
+                        f"No exchange rate found from {from_currency.code} "
+                        f"to {to_currency.code}"
+                    )
+                converted_amount = amount_decimal * rate
             
-            rprint(f"Exchange rate: 1 {from_account.currency.code} = "
-                  f"{rate:.{to_account.currency.decimals}f} {to_account.currency.code}")
-            rprint(f"Converting {from_account.currency.symbol}{amount_decimal:.{from_account.currency.decimals}f} to "
-                  f"{to_account.currency.symbol}{converted_amount:.{to_account.currency.decimals}f}")
+                rprint(f"Exchange rate: 1 {from_currency.code} = "
+                      f"{rate:.{to_currency.decimals}f} {to_currency.code}")
+                rprint(f"Converting {from_money(amount_decimal)} to {to_money(converted_amount)}")
         
-        transaction = transaction_service.create_transfer(
-            from_id, to_id, amount_decimal, description
-        )
+            transaction = transaction_service.create_transfer(
+                from_id, to_id, amount_decimal, description
+            )
         
-        debit_legs = [leg for leg in transaction.legs if leg.debit is not None and leg.debit > 0]
-        credit_legs = [leg for leg in transaction.legs if leg.credit is not None and leg.credit > 0]
-        from_amount = debit_legs[0].debit if debit_legs else Decimal("0")
-        to_amount = credit_legs[0].credit if credit_legs else Decimal("0")
+            debit_legs = [leg for leg in transaction.legs if leg.debit is not None and leg.debit > 0]
+            credit_legs = [leg for leg in transaction.legs if leg.credit is not None and leg.credit > 0]
+            from_amount = debit_legs[0].debit if debit_legs else DECIMAL_ZERO
+            to_amount = credit_legs[0].credit if credit_legs else DECIMAL_ZERO
         
-        rprint(f"[green]Successfully transferred[/green] "
-               f"{from_account.currency.symbol}{from_amount:.{from_account.currency.decimals}f} "
-               f"from {from_account.name}")
-        if from_account.currency_id != to_account.currency_id:
-            rprint(f"[green]Received:[/green] "
-                   f"{to_account.currency.symbol}{to_amount:.{to_account.currency.decimals}f} "
-                   f"in {to_account.name}")
+            rprint(f"[green]Successfully transferred[/green] {from_money(from_amount)} from {from_name}")
+            if converting:
+                rprint(f"[green]Received:[/green] {to_money(to_amount)} in {to_name}")
             
-    except Exception as e:
-        rprint(f"[red]Transfer failed:[/red] {str(e)}")
+        except Exception as e:
+            rprint(f"[red]Transfer failed:[/red] {str(e)}")
+
+def _warn_if_truncated(count: int, limit: int) -> None:
+    """Tell the user on stderr when a listing was cut off at --limit"""
+    if count == limit:
+        typer.echo(
+            f"Showing the first {limit} transactions; use --limit/--days to widen.",
+            err=True,
+        )
 
 @app.command()
 def list(
     account_id: int | None = typer.Option(None, "--account", "-a", help="Account ID"),
     days: int = typer.Option(30, "--days", "-d", help="Number of days of history to show"),
     show_legs: bool = SHOW_LEGS,
+    limit: int = LIMIT,
+    plain: bool = PLAIN,
 ):
     """List recent transactions"""
-    db = next(get_db())
-    service = TransactionService(db)
-    account_service = AccountService(db)
+    from rich.console import Console
+    from rich.table import Column, Table
+    from database import SessionLocal
+    from modules.transactions.service import TransactionService
 
-    end_date = datetime.now().date()
-    start_date = end_date - timedelta(days=days)
+    console = Console(highlight=False)
+    with SessionLocal() as db:
+        service = TransactionService(db)
 
-    if account_id:
-        transactions = service.get_account_transactions(
-            account_id, start_date, end_date
-        )
-    else:
-        transactions = service.get_all()
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=days)
 
-    if show_legs:
-        for tx in transactions:
-            console.print(
-                f"\n[bold]{tx.date.strftime('%Y-%m-%d')} - {tx.description or 'No description'}[/bold]"
+        if show_legs:
+            transactions = service.get_all_with_legs(
+                start_date, end_date, account_id, limit=limit
             )
-            legs_table = Table("Account", "Debit", "Credit")
-
-            for leg in service.get_transaction_legs(tx.id):
-                account = account_service.get(leg.account_id)
-                if account:
-                    legs_table.add_row(
-                        account.name,
-                        f"{Decimal(str(leg.debit)):.2f}" if leg.debit else "",
-                        f"{Decimal(str(leg.credit)):.2f}" if leg.credit else "",
+            _warn_if_truncated(len(transactions), limit)
+            if plain:
+                # One line per leg; csv quotes any tab or newline in a field
+                writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+                writer.writerows(
+                    (
+                        tx.date.isoformat(),
+                        tx.description or "",
+                        leg.account.name,
+                        f"{leg.debit:.2f}" if leg.debit else "",
+                        f"{leg.credit:.2f}" if leg.credit else "",
                     )
-            console.print(legs_table)
-    else:
-        table = Table("Date", "Description", "Net Amount", "Accounts Involved")
-        for tx in transactions:
-            legs = service.get_transaction_legs(tx.id)
+                    for tx in transactions
+                    for leg in tx.legs
+                    if leg.account
+                )
+                return
 
-            net_amount = max((Decimal(str(leg.credit or 0))) for leg in legs)
-            if net_amount == Decimal("0.00"):
-                net_amount = max((Decimal(str(leg.debit or 0))) for leg in legs)
+            for tx in transactions:
+                console.print(
+                    f"\n[bold]{tx.date.isoformat()} - {tx.description or 'No description'}[/bold]"
+                )
+                legs_table = Table(
+                    "Account",
+                    Column("Debit", no_wrap=True, overflow="ignore"),
+                    Column("Credit", no_wrap=True, overflow="ignore"),
+                )
 
-            account_names = []  # List[str]
-            for leg in legs:
-                account = account_service.get(leg.account_id)
-                if account:
-                    account_names.append(account.name)
+                for leg in tx.legs:
+                    account = leg.account
+                    if account:
+                        legs_table.add_row(
+                            account.name,
+                            f"{leg.debit:.2f}" if leg.debit else "",
+                            f"{leg.credit:.2f}" if leg.credit else "",
+                        )
+                console.print(legs_table)
+        else:
+            summaries = service.get_transaction_summaries(
+                start_date, end_date, account_id, limit=limit
+            )
+            _warn_if_truncated(len(summaries), limit)
+            if plain:
+                # Skip Rich's per-cell measuring entirely for large or piped
+                # output; csv quotes any tab or newline in a field
+                writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+                writer.writerows(
+                    (
+                        row.date.isoformat(),
+                        row.description or "",
+                        f"{row.max_cr or row.max_db or DECIMAL_ZERO:.2f}",
+                        row.account_names or "",
+                    )
+                    for row in summaries
+                )
+                return
 
-            table.add_row(
-                tx.date.strftime("%Y-%m-%d"),
-                tx.description or "",
-                f"{net_amount:.2f}",
-                ", ".join(account_names),
+            table = Table(
+                "Date",
+                "Description",
+                Column("Net Amount", no_wrap=True, overflow="ignore"),
+                "Accounts Involved",
             )
-        console.print(table)
\ No newline at end of file
+            for row in summaries:
+                net_amount = row.max_cr or row.max_db or DECIMAL_ZERO
+
+                table.add_row(
+                    row.date.isoformat(),
+                    row.description or "",
+                    f"{net_amount:.2f}",
+                    row.account_names or "",
+                )
+            console.print(table)
\ No newline at end of file
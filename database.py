@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
@@ -11,6 +11,17 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL with relaxed syncing so each commit doesn't wait on a full fsync"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.close()
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -28,11 +39,17 @@ def get_db():
 
 def init_db():
     # Import all models so they are registered with SQLAlchemy
-    # import models.accounts
-    # import models.categories
-    # import models.transactions
-    # import models.scheduled_transactions
-    # import models.scenarios
-    # import models.users
+    import models.accounts
+    import models.categories
+    import models.transactions
+    import models.scheduled_transactions
+    import models.scenarios
+    import models.users
 
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips tables that already exist, so indexes added to a model
+    # later would never reach an existing database without this
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
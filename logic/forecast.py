@@ -1,40 +1,64 @@
-from datetime import date
-from typing import List
-from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY
+from datetime import date, timedelta
+from typing import Iterator, List
+from dateutil.rrule import rrule, MONTHLY
 from models.scheduled_transactions import RecurrenceType, ScheduledTransaction
 from schemas.forecast_transactions import ForecastTransaction
-from decimal import Decimal
 
 
+# Fixed-length recurrences are stepped with plain date arithmetic
+STEP_MAP = {
+    RecurrenceType.DAILY: timedelta(days=1),
+    RecurrenceType.WEEKLY: timedelta(weeks=1),
+}
+
+# Months vary in length, so these still go through rrule (which skips months
+# that don't have the start day rather than clamping to the month end)
 FREQUENCY_MAP = {
-    RecurrenceType.DAILY: DAILY,
-    RecurrenceType.WEEKLY: WEEKLY,
     RecurrenceType.MONTHLY: MONTHLY,
 }
 
 
+def _occurrences(recurrence: RecurrenceType, start: date, end: date) -> Iterator[date]:
+    """Yield each date a recurrence falls on between start and end, inclusive"""
+    step = STEP_MAP.get(recurrence)
+    if step:
+        current = start
+        while current <= end:
+            yield current
+            current += step
+    elif recurrence in FREQUENCY_MAP:
+        for dt in rrule(FREQUENCY_MAP[recurrence], dtstart=start, until=end):
+            yield dt.date()
+
+
 def expand_scheduled_transactions(
     scheduled: List[ScheduledTransaction],
     start_date: date,
     end_date: date
 ) -> List[ForecastTransaction]:
     forecast = []
+    append = forecast.append
 
     for item in scheduled:
-        freq = FREQUENCY_MAP.get(item.recurrence)
-        if not freq:
+        if item.recurrence not in STEP_MAP and item.recurrence not in FREQUENCY_MAP:
             continue  # Skip if unknown recurrence type
 
         rule_start = max(item.start_date, start_date)
         rule_end = min(item.end_date or end_date, end_date)
+
+        # Read the item's fields once rather than on every occurrence
+        name = item.description
+        amount = item.amount
+        source_account_id = item.from_account_id
+        destination_account_id = item.to_account_id
         
-        for dt in rrule(freq, dtstart=rule_start, until=rule_end):
-            forecast.append(ForecastTransaction(
-                date=dt.date(),
-                name=item.description,
-                amount=Decimal(str(item.amount)),
-                source_account_id=item.from_account_id,
-                destination_account_id=item.to_account_id,
+        for dt in _occurrences(item.recurrence, rule_start, rule_end):
+            append(ForecastTransaction(
+                date=dt,
+                name=name,
+                amount=amount,
+                source_account_id=source_account_id,
+                destination_account_id=destination_account_id,
             ))
 
     return forecast
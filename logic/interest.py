@@ -14,7 +14,9 @@ def accrue_interest(account: Account, days: int):
     else:
         return 0
 
-    interest = Decimal(str(account.balance)) * ((Decimal(1) + Decimal(str(daily_rate))) ** days - Decimal(1))
+    # balance is a Numeric column and already a Decimal; only the float rate
+    # needs converting
+    interest = account.balance * ((Decimal(1) + Decimal(str(daily_rate))) ** days - Decimal(1))
     return interest
 
 def accrue_overdraft_interest(account: Account, days: int):
@@ -25,6 +27,6 @@ def accrue_overdraft_interest(account: Account, days: int):
         return 0
 
     daily_rate = float(account.overdraft_interest_rate) / 365
-    overdraft_amount = abs(min(Decimal(str(account.balance)), Decimal(str(account.overdraft_limit or 0))))
+    overdraft_amount = abs(min(account.balance, account.overdraft_limit or Decimal(0)))
     interest = overdraft_amount * ((Decimal(1) + Decimal(str(daily_rate))) ** days - Decimal(1))
     return interest
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     Enum as SqlEnum,
     DateTime,
+    Index,
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from database import Base
@@ -72,6 +73,11 @@ class ExchangeRate(Base):
         back_populates="exchange_rates_to"
     )
 
+    __table_args__ = (
+        # Rate lookups and history are always for one pair, newest first
+        Index("ix_exchange_rates_pair_timestamp", "from_currency_id", "to_currency_id", "timestamp"),
+    )
+
 
 class Account(Base):
     __tablename__: str = "accounts"
@@ -10,7 +10,7 @@ class Transaction(Base):
     __tablename__: str = "transactions"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     description: Mapped[str] = mapped_column(String)
-    date: Mapped[datetime] = mapped_column(Date)
+    date: Mapped[datetime] = mapped_column(Date, index=True)
     currency_id: Mapped[int] = mapped_column(Integer, ForeignKey("currencies.id"), nullable=False)
     
     # Relationships
@@ -22,13 +22,13 @@ class TransactionLeg(Base):
     __tablename__: str = "transaction_legs"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     transaction_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("transactions.id"), nullable=False
+        Integer, ForeignKey("transactions.id"), nullable=False, index=True
     )
     account_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("accounts.id"), nullable=False
+        Integer, ForeignKey("accounts.id"), nullable=False, index=True
     )
     pot_id: Mapped[int | None] = mapped_column(
-        Integer, ForeignKey("pots.id"), nullable=True
+        Integer, ForeignKey("pots.id"), nullable=True, index=True
     )
     currency_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("currencies.id"), nullable=False
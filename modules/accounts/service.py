@@ -2,7 +2,7 @@ from modules.common.base_service import BaseService
 from models.accounts import Account, Pot, AccountType, Currency
 from models.transactions import Transaction
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
 from datetime import date
 from modules.transactions.service import TransactionService
 
@@ -14,6 +14,49 @@ class AccountService(BaseService[Account]):
         super().__init__(Account, db)
         self.transaction_service = TransactionService(db)
 
+    def get(self, id: int) -> Account | None:
+        """Get an account by its ID with its currency loaded up front"""
+        return self.db.get(Account, id, options=[joinedload(Account.currency)])
+
+    def get_all(self) -> list[Account]:
+        """Get all accounts with their pots and currency loaded up front"""
+        return (
+            self.db.query(Account)
+            .options(selectinload(Account.pots), joinedload(Account.currency))
+            .all()
+        )
+
+    def list_accounts(
+        self, account_id: int | None = None, with_pots_only: bool = False
+    ) -> list[Account]:
+        """
+        Get all accounts (or just `account_id`) for display, loading only the
+        account and pot columns that listings render, along with each
+        account's currency. `with_pots_only` skips accounts without pots.
+        """
+        query = self.db.query(Account)
+        if account_id:
+            query = query.filter(Account.id == account_id)
+        if with_pots_only:
+            query = query.filter(Account.pots.any())
+        return (
+            query
+            .options(
+                load_only(
+                    Account.id,
+                    Account.name,
+                    Account.type,
+                    Account.currency_id,
+                    Account.balance,
+                ),
+                selectinload(Account.pots).load_only(
+                    Pot.id, Pot.name, Pot.target_amount, Pot.account_id
+                ),
+                joinedload(Account.currency),
+            )
+            .all()
+        )
+
     def create_account(
         self,
         name: str,
@@ -57,7 +100,15 @@ class AccountService(BaseService[Account]):
         
     def get_pot(self, pot_id: int) -> Pot | None:
         """Get a pot by its ID"""
-        return self.db.query(Pot).get(pot_id)
+        return self.db.get(Pot, pot_id)
+
+    def get_pot_with_account(self, pot_id: int) -> Pot | None:
+        """Get a pot along with its account and the account's currency"""
+        return self.db.get(
+            Pot,
+            pot_id,
+            options=[joinedload(Pot.account).joinedload(Account.currency)],
+        )
 
     def transfer(
         self, from_id: int, to_id: int, amount: Decimal, description: str | None = None
@@ -81,8 +132,8 @@ class AccountService(BaseService[Account]):
             description=description,
         )
 
-    DEFAULT_POT_TARGET: Decimal = Decimal(0.0)
-    DEFAULT_POT_AMOUNT: Decimal = Decimal(0.0)
+    DEFAULT_POT_TARGET: Decimal = Decimal("0")
+    DEFAULT_POT_AMOUNT: Decimal = Decimal("0")
 
     def create_pot(
         self,
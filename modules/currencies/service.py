@@ -2,14 +2,33 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import Row, and_, bindparam, func, select
 
 from modules.common.base_service import BaseService
 from models.accounts import Currency, ExchangeRate, CurrencyType
 
+# Built once so every call reuses the same statement and its compiled SQL
+RATE_HISTORY_QUERY = (
+    select(ExchangeRate)
+    .where(
+        and_(
+            ExchangeRate.from_currency_id == bindparam("from_currency_id"),
+            ExchangeRate.to_currency_id == bindparam("to_currency_id"),
+            ExchangeRate.timestamp >= bindparam("start"),
+            ExchangeRate.timestamp <= bindparam("end"),
+        )
+    )
+    .order_by(ExchangeRate.timestamp.desc())
+)
+
+
 class CurrencyService(BaseService[Currency]):
     def __init__(self, db: Session):
         super().__init__(Currency, db)
+        # (from_code, to_code, at_time) -> rate, cleared whenever a rate is written
+        self._rate_cache: dict[tuple[str, str, Optional[datetime]], Optional[Decimal]] = {}
+        # code -> currency, cleared whenever a currency is created
+        self._code_cache: dict[str, Optional[Currency]] = {}
 
     def create_currency(
         self,
@@ -35,11 +54,17 @@ class CurrencyService(BaseService[Currency]):
         self.db.add(currency)
         self.db.commit()
         self.db.refresh(currency)
+        self._code_cache.clear()
         return currency
 
     def get_by_code(self, code: str) -> Optional[Currency]:
         """Get a currency by its code"""
-        return self.db.query(Currency).filter(Currency.code == code.upper()).first()
+        code = code.upper()
+        if code not in self._code_cache:
+            self._code_cache[code] = (
+                self.db.query(Currency).filter(Currency.code == code).first()
+            )
+        return self._code_cache[code]
 
     def list_currencies(self, type: Optional[CurrencyType] = None) -> List[Currency]:
         """List all active currencies, optionally filtered by type"""
@@ -48,6 +73,14 @@ class CurrencyService(BaseService[Currency]):
             query = query.filter(Currency.type == type)
         return query.all()
 
+    def list_currency_tuples(self) -> List[Row[tuple[int, str, str, int]]]:
+        """List the id, code, name and decimals of all active currencies without loading full rows"""
+        return (
+            self.db.query(Currency.id, Currency.code, Currency.name, Currency.decimals)
+            .filter(Currency.is_active == True)
+            .all()
+        )
+
     def set_exchange_rate(
         self,
         from_currency_code: str,
@@ -72,9 +105,44 @@ class CurrencyService(BaseService[Currency]):
         self.db.add(exchange_rate)
         self.db.commit()
         self.db.refresh(exchange_rate)
+        self._rate_cache.clear()
         
         return exchange_rate
 
+    def set_exchange_rate_pair(
+        self,
+        from_currency_code: str,
+        to_currency_code: str,
+        rate: Decimal,
+        timestamp: Optional[datetime] = None
+    ) -> tuple[ExchangeRate, ExchangeRate]:
+        """Set an exchange rate and its inverse in a single commit"""
+        from_currency = self.get_by_code(from_currency_code)
+        to_currency = self.get_by_code(to_currency_code)
+
+        if not from_currency or not to_currency:
+            raise ValueError("One or both currencies not found")
+
+        timestamp = timestamp or datetime.utcnow()
+        exchange_rate = ExchangeRate(
+            from_currency_id=from_currency.id,
+            to_currency_id=to_currency.id,
+            rate=rate,
+            timestamp=timestamp
+        )
+        inverse_rate = ExchangeRate(
+            from_currency_id=to_currency.id,
+            to_currency_id=from_currency.id,
+            rate=Decimal(1) / rate,
+            timestamp=timestamp
+        )
+
+        self.db.add_all([exchange_rate, inverse_rate])
+        self.db.commit()
+        self._rate_cache.clear()
+
+        return exchange_rate, inverse_rate
+
     def get_exchange_rate(
         self,
         from_currency_code: str,
@@ -82,6 +150,10 @@ class CurrencyService(BaseService[Currency]):
         at_time: Optional[datetime] = None
     ) -> Optional[Decimal]:
         """Get the latest exchange rate between two currencies"""
+        key = (from_currency_code.upper(), to_currency_code.upper(), at_time)
+        if key in self._rate_cache:
+            return self._rate_cache[key]
+
         from_currency = self.get_by_code(from_currency_code)
         to_currency = self.get_by_code(to_currency_code)
         
@@ -108,7 +180,57 @@ class CurrencyService(BaseService[Currency]):
             # Get latest rate
             rate = query.order_by(ExchangeRate.timestamp.desc()).first()
             
-        return rate.rate if rate else None
+        self._rate_cache[key] = rate.rate if rate else None
+        return self._rate_cache[key]
+
+    def get_rate_history(
+        self,
+        from_currency_id: int,
+        to_currency_id: int,
+        start: datetime,
+        end: datetime
+    ) -> List[ExchangeRate]:
+        """Get the rates recorded between two currencies in a time window, newest first"""
+        return list(
+            self.db.execute(
+                RATE_HISTORY_QUERY,
+                {
+                    "from_currency_id": from_currency_id,
+                    "to_currency_id": to_currency_id,
+                    "start": start,
+                    "end": end,
+                },
+            ).scalars()
+        )
+
+    def get_latest_rates(self, base_currency_code: str) -> dict[int, Decimal]:
+        """Get the latest rate from a currency to every other currency, keyed by target currency ID"""
+        base_currency = self.get_by_code(base_currency_code)
+        if not base_currency:
+            raise ValueError("Currency not found")
+
+        latest = (
+            self.db.query(
+                ExchangeRate.to_currency_id,
+                func.max(ExchangeRate.timestamp).label("timestamp"),
+            )
+            .filter(ExchangeRate.from_currency_id == base_currency.id)
+            .group_by(ExchangeRate.to_currency_id)
+            .subquery()
+        )
+        rows = (
+            self.db.query(ExchangeRate.to_currency_id, ExchangeRate.rate)
+            .join(
+                latest,
+                and_(
+                    ExchangeRate.to_currency_id == latest.c.to_currency_id,
+                    ExchangeRate.timestamp == latest.c.timestamp,
+                ),
+            )
+            .filter(ExchangeRate.from_currency_id == base_currency.id)
+            .all()
+        )
+        return {to_currency_id: rate for to_currency_id, rate in rows}
 
     def convert_amount(
         self,
@@ -40,8 +40,12 @@ class CSVImporter:
         if df.empty:
             raise ValueError("No transactions found in file")
             
+        # Parse the whole date column in one vectorised call; rows that don't
+        # match the format come back as NaT and are reported below
+        dates = pd.to_datetime(df[fmt.date_column], format=fmt.date_format, errors="coerce")
+
         transactions: list[ImportedTransaction] = []
-        for _, row in df.iterrows():
+        for row, date in zip(df.to_dict("records"), dates):
             try:
                 # Parse amount
                 amount_str = str(row[fmt.amount_column])
@@ -49,8 +53,10 @@ class CSVImporter:
                     amount_str = amount_str.replace(fmt.currency_symbol, '')
                 amount = Decimal(amount_str.replace(fmt.thousands_separator, ''))
                 
-                # Parse date
-                date = pd.to_datetime(row[fmt.date_column], format=fmt.date_format)
+                if pd.isna(date):
+                    raise ValueError(
+                        f'time data "{row[fmt.date_column]}" doesn\'t match format "{fmt.date_format}"'
+                    )
                 
                 # Create transaction
                 tx = ImportedTransaction(
@@ -66,19 +72,18 @@ class CSVImporter:
                 
             except Exception as e:
                 # Log error but continue with other rows
-                print(f"Error parsing row: {row.to_dict()}. Error: {str(e)}")
+                print(f"Error parsing row: {row}. Error: {str(e)}")
                 continue
                 
         if not transactions:
             raise ValueError("No valid transactions could be parsed from file")
             
         # Get date range and balances
-        dates = [tx.date for tx in transactions]
         balances = [tx.balance for tx in transactions if tx.balance is not None]
         
         statement = BankStatement(
-            start_date=min(dates),
-            end_date=max(dates),
+            start_date=min(tx.date for tx in transactions),
+            end_date=max(tx.date for tx in transactions),
             end_balance=balances[-1] if balances else None,
             start_balance=balances[0] if balances else None,
             transactions=transactions
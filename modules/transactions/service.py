@@ -2,8 +2,9 @@ from modules.common.base_service import BaseService
 from models.transactions import Transaction, TransactionLeg
 from models.accounts import Account, Pot
 from modules.currencies.service import CurrencyService
-from sqlalchemy.orm import Session
-from typing import cast, TypedDict, NotRequired, Optional
+from sqlalchemy import Row, func, insert
+from sqlalchemy.orm import Session, selectinload
+from typing import TypedDict, NotRequired, Optional
 from decimal import Decimal
 from datetime import datetime, date, timezone
 
@@ -72,8 +73,8 @@ class TransactionService(BaseService[Transaction]):
         """Create a transfer between two accounts using double-entry accounting"""
 
         # Get accounts to update balances
-        from_account = cast(Account, self.db.query(Account).get(from_account_id))
-        to_account = cast(Account, self.db.query(Account).get(to_account_id))
+        from_account = self.db.get(Account, from_account_id)
+        to_account = self.db.get(Account, to_account_id)
         if not from_account or not to_account:
             raise ValueError("One or both accounts not found")
             
@@ -100,9 +101,10 @@ class TransactionService(BaseService[Transaction]):
         self.db.flush()  # Get the transaction ID
 
         # Create the debit leg (money leaving the source account)
-        debit_leg = TransactionLeg(
+        debit_leg = dict(
             transaction_id=transaction.id,
             account_id=from_account_id,
+            pot_id=None,
             debit=from_amount,
             credit=None,
             currency_id=from_account.currency_id,
@@ -110,9 +112,10 @@ class TransactionService(BaseService[Transaction]):
         )
 
         # Create the credit leg (money entering the destination account)
-        credit_leg = TransactionLeg(
+        credit_leg = dict(
             transaction_id=transaction.id,
             account_id=to_account_id,
+            pot_id=None,
             debit=None,
             credit=to_amount,
             currency_id=to_account.currency_id,
@@ -123,7 +126,11 @@ class TransactionService(BaseService[Transaction]):
         from_account.balance = from_account.balance - from_amount
         to_account.balance = to_account.balance + to_amount
 
-        self.db.add_all([debit_leg, credit_leg])
+        # Both legs go in as one executemany INSERT rather than a row at a time
+        self.db.execute(
+            insert(TransactionLeg).execution_options(render_nulls=True),
+            [debit_leg, credit_leg],
+        )
         self.db.commit()
         self.db.refresh(transaction)
 
@@ -152,7 +159,7 @@ class TransactionService(BaseService[Transaction]):
             )
 
         # Get the first account to use its currency as the base currency for the transaction
-        first_account = cast(Account, self.db.query(Account).get(legs[0]["account_id"]))
+        first_account = self.db.get(Account, legs[0]["account_id"])
         if not first_account:
             raise ValueError("First account not found")
 
@@ -168,7 +175,7 @@ class TransactionService(BaseService[Transaction]):
         # Create all legs
         transaction_legs: list[TransactionLeg] = []
         for leg in legs:
-            account = cast(Account, self.db.query(Account).get(leg["account_id"]))
+            account = self.db.get(Account, leg["account_id"])
             if not account:
                 raise ValueError(f"Account {leg['account_id']} not found")
 
@@ -231,6 +238,76 @@ class TransactionService(BaseService[Transaction]):
 
         return query.order_by(Transaction.date.desc()).all()
 
+    def get_all_with_legs(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        account_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[Transaction]:
+        """
+        Get transactions with their legs and each leg's account loaded up front,
+        optionally restricted to those involving a specific account. At most
+        `limit` of the most recent transactions are returned when given.
+        """
+        query = self.db.query(Transaction).options(
+            selectinload(Transaction.legs).joinedload(TransactionLeg.account)
+        )
+
+        if account_id:
+            query = query.filter(
+                Transaction.legs.any(TransactionLeg.account_id == account_id)
+            )
+        if start_date:
+            query = query.filter(Transaction.date >= start_date)
+        if end_date:
+            query = query.filter(Transaction.date <= end_date)
+
+        query = query.order_by(Transaction.date.desc(), Transaction.id.desc())
+        if limit:
+            query = query.limit(limit)
+
+        return query.all()
+
+    def get_transaction_summaries(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        account_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[Row]:
+        """
+        Get one (date, description, max_cr, max_db, account_names) row per
+        transaction, with the leg aggregation done in SQL, newest first.
+        """
+        query = (
+            self.db.query(
+                Transaction.date,
+                Transaction.description,
+                func.max(TransactionLeg.credit).label("max_cr"),
+                func.max(TransactionLeg.debit).label("max_db"),
+                func.group_concat(Account.name, ", ").label("account_names"),
+            )
+            .join(Transaction.legs)
+            .outerjoin(TransactionLeg.account)
+            .group_by(Transaction.id)
+        )
+
+        if account_id:
+            query = query.filter(
+                Transaction.legs.any(TransactionLeg.account_id == account_id)
+            )
+        if start_date:
+            query = query.filter(Transaction.date >= start_date)
+        if end_date:
+            query = query.filter(Transaction.date <= end_date)
+
+        query = query.order_by(Transaction.date.desc(), Transaction.id.desc())
+        if limit:
+            query = query.limit(limit)
+
+        return query.all()
+
     def get_transaction_legs(self, transaction_id: int) -> list[TransactionLeg]:
         """Get all legs for a specific transaction"""
         return (
@@ -243,32 +320,14 @@ class TransactionService(BaseService[Transaction]):
         self, account_id: int, as_of_date: date | None = None
     ) -> Decimal:
         """Calculate account balance based on all transaction legs"""
-        query = (
-            self.db.query(TransactionLeg)
-            .join(Transaction)
-            .filter(TransactionLeg.account_id == account_id)
-        )
-
-        if as_of_date:
-            query = query.filter(Transaction.date <= as_of_date)
-
-        legs = query.all()
-
-        balance = Decimal("0.00")
-        for leg in legs:
-            if leg.credit:
-                balance += Decimal(str(leg.credit))
-            if leg.debit:
-                balance -= Decimal(str(leg.debit))
-
-        return balance
+        return self._sum_legs(TransactionLeg.account_id == account_id, as_of_date)
 
     def _validate_pot_ownership(self, pot_id: int, account_id: int) -> None:
         """
         Validate that a pot belongs to the specified account.
         Raises ValueError if validation fails.
         """
-        pot = self.db.query(Pot).get(pot_id)
+        pot = self.db.get(Pot, pot_id)
         if not pot:
             raise ValueError(f"Pot {pot_id} not found")
         if pot.account_id != account_id:
@@ -278,25 +337,40 @@ class TransactionService(BaseService[Transaction]):
         """
         Calculate pot balance based on all transaction legs involving this pot.
         """
-        query = (
-            self.db.query(TransactionLeg)
-            .join(Transaction)
-            .filter(TransactionLeg.pot_id == pot_id)
-        )
+        return self._sum_legs(TransactionLeg.pot_id == pot_id, as_of_date)
+
+    def _sum_legs(self, criterion, as_of_date: date | None = None) -> Decimal:
+        """Sum credits minus debits over the legs matching `criterion` in SQL"""
+        query = self.db.query(
+            func.coalesce(func.sum(TransactionLeg.credit), 0)
+            - func.coalesce(func.sum(TransactionLeg.debit), 0)
+        ).filter(criterion)
 
         if as_of_date:
-            query = query.filter(Transaction.date <= as_of_date)
+            query = query.join(Transaction).filter(Transaction.date <= as_of_date)
 
-        legs = query.all()
+        return query.scalar()
 
-        balance = Decimal("0.00")
-        for leg in legs:
-            if leg.credit:
-                balance += Decimal(str(leg.credit))
-            if leg.debit:
-                balance -= Decimal(str(leg.debit))
+    def get_pot_balances(self, pot_ids: list[int]) -> dict[int, Decimal]:
+        """
+        Calculate balances for several pots with a single aggregate query.
+        Pots without any transaction legs are omitted from the result.
+        """
+        if not pot_ids:
+            return {}
+
+        rows = (
+            self.db.query(
+                TransactionLeg.pot_id,
+                func.coalesce(func.sum(TransactionLeg.credit), 0)
+                - func.coalesce(func.sum(TransactionLeg.debit), 0),
+            )
+            .filter(TransactionLeg.pot_id.in_(pot_ids))
+            .group_by(TransactionLeg.pot_id)
+            .all()
+        )
 
-        return balance
+        return dict(rows)
 
     def transfer_to_pot(
         self,
@@ -403,3 +477,31 @@ class TransactionService(BaseService[Transaction]):
             query = query.filter(Transaction.date <= end_date)
 
         return query.order_by(Transaction.date.desc()).all()
+
+    def get_pot_legs(
+        self,
+        pot_id: int,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list[Row]:
+        """
+        Get (date, description, credit, debit) rows for every leg posted to a
+        pot, newest first.
+        """
+        query = (
+            self.db.query(
+                Transaction.date,
+                Transaction.description,
+                TransactionLeg.credit,
+                TransactionLeg.debit,
+            )
+            .join(TransactionLeg.transaction)
+            .filter(TransactionLeg.pot_id == pot_id)
+        )
+
+        if start_date:
+            query = query.filter(Transaction.date >= start_date)
+        if end_date:
+            query = query.filter(Transaction.date <= end_date)
+
+        return query.order_by(Transaction.date.desc()).all()
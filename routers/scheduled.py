@@ -20,7 +20,7 @@ def list_scheduled_txns(db: Session = Depends(get_db)):
 
 @router.get("/{txn_id}", response_model=ScheduledTransactionRead)
 def get_scheduled_txn(txn_id: int, db: Session = Depends(get_db)):
-    txn = db.query(ScheduledTransaction).get(txn_id)
+    txn = db.get(ScheduledTransaction, txn_id)
     if txn is None:
         raise HTTPException(status_code=404, detail="Scheduled transaction not found")
     return txn